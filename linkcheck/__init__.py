@@ -93,6 +93,34 @@ def get_link_pat(arg, strict=False):
     }
 
 
+def get_combined_pat(regexes):
+    """Combine compiled regular expressions into one pattern that
+    matches wherever any of them matches. This allows to test many
+    patterns with only one search.
+
+    @param regexes: compiled regular expressions
+    @type regexes: sequence
+    @return: compiled alternation pattern, or None if the patterns
+        cannot be combined without changing their meaning (eg. when
+        they have groups or different flags)
+    @rtype: compiled regex or None
+    """
+    if not regexes:
+        return None
+    flags = regexes[0].flags
+    if flags & re.VERBOSE:
+        return None
+    if any(regex.groups or regex.flags != flags for regex in regexes):
+        return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{regex.pattern})" for regex in regexes), flags
+        )
+    except re.error:
+        # eg. inline global flags that are not at the start
+        return None
+
+
 def init_i18n():
     """Initialize i18n with the configured locale dir. The environment
     variable LOCPATH can also specify a locale dir.
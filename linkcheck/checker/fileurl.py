@@ -93,6 +93,13 @@ class FileUrl(urlbase.UrlBase):
     Url link with file scheme.
     """
 
+    __slots__ = ("_is_directory",)
+
+    def reset(self):
+        super().reset()
+        # cached result of is_directory()
+        self._is_directory = None
+
     def init(
         self,
         base_ref,
@@ -183,10 +190,8 @@ class FileUrl(urlbase.UrlBase):
             # Directory size always differs from the customer index.html
             # that is generated. So return without calculating any size.
             return
-        filename = self.get_os_filename()
-        self.size = fileutil.get_size(filename)
-        self.modified = datetime.fromtimestamp(
-            fileutil.get_mtime(filename), tz=timezone.utc)
+        self.size, mtime = fileutil.get_size_mtime(self.get_os_filename())
+        self.modified = datetime.fromtimestamp(mtime, tz=timezone.utc)
 
     def check_connection(self):
         """
@@ -256,8 +261,11 @@ class FileUrl(urlbase.UrlBase):
         @return: True iff file is a directory
         @rtype: bool
         """
-        filename = self.get_os_filename()
-        return os.path.isdir(filename) and not os.path.islink(filename)
+        if self._is_directory is None:
+            filename = self.get_os_filename()
+            isdir = os.path.isdir(filename) and not os.path.islink(filename)
+            self._is_directory = isdir
+        return self._is_directory
 
     def is_parseable(self):
         """Check if content is parseable for recursion.
@@ -312,6 +320,8 @@ class AnchorCheckFileUrl(FileUrl):
     File URL link for AnchorCheck plugin.
     """
 
+    __slots__ = ("url_without_anchor",)
+
     def reset(self):
         super().reset()
         # the local file URI
@@ -340,7 +350,10 @@ class AnchorCheckFileUrl(FileUrl):
             )
             self.urlparts[2] += '/'
         self.url = urlutil.urlunsplit(self.urlparts)
-        self.url_without_anchor = urlutil.urlunsplit(self.urlparts[:4] + [''])
+        parts = self.urlparts
+        self.url_without_anchor = urlutil.urlunsplit(
+            (parts[0], parts[1], parts[2], parts[3], '')
+        )
 
     def check_connection(self):
         """
@@ -30,7 +30,6 @@ warnings.simplefilter(
     'ignore', requests.packages.urllib3.exceptions.InsecureRequestWarning
 )
 
-from io import BytesIO
 import re
 
 from .. import (
@@ -58,6 +57,8 @@ class HttpUrl(internpaturl.InternPatternUrl):
     Url link with http scheme.
     """
 
+    __slots__ = ("headers", "auth", "session", "ssl_cipher", "ssl_cert")
+
     def reset(self):
         """
         Initialize HTTP specific variables.
@@ -239,8 +240,9 @@ class HttpUrl(internpaturl.InternPatternUrl):
             # (or subset) character set must be labelled with a charset,
             # that is not always the case and then the default ISO-8859-1 is
             # set by Requests.
-            # We fall back to it in UrlBase.get_content() if Beautiful Soup
-            # doesn't return an encoding.
+            # Ignore it, so a charset declared in the content is used.
+            # Without one UrlBase.get_content() tries UTF-8 and falls back
+            # to ISO-8859-1 if that fails to decode.
             self.content_encoding = None
         else:
             self.content_encoding = encoding
@@ -341,13 +343,19 @@ class HttpUrl(internpaturl.InternPatternUrl):
     def read_content(self):
         """Return data and data size for this URL.
         Can be overridden in subclasses."""
-        maxbytes = self.aggregate.config["maxfilesizedownload"]
-        buf = BytesIO()
-        for data in self.url_connection.iter_content(chunk_size=self.ReadChunkBytes):
-            if buf.tell() + len(data) > maxbytes:
+        maxbytes = self.aggregate.maxfilesizedownload
+        # Read a body of known size with one call. The size is taken from
+        # the Content-Length header, see add_size_info().
+        chunk_size = max(self.ReadChunkBytes, min(self.size, maxbytes))
+        chunks = []
+        size = 0
+        for data in self.url_connection.iter_content(chunk_size=chunk_size):
+            size += len(data)
+            if size > maxbytes:
                 raise LinkCheckerError(_("File size too large"))
-            buf.write(data)
-        return buf.getvalue()
+            chunks.append(data)
+        # joining a single chunk does not copy it
+        return b"".join(chunks)
 
     def parse_header_links(self):
         """Parse URLs in HTTP headers Link:."""
@@ -44,13 +44,15 @@ def get_intern_pattern(url):
     args = list(re.escape(x) for x in (scheme, domain, path))
     if args[0] in ('http', 'https'):
         args[0] = 'https?'
-    args[1] = r"(www\.|)%s" % args[1]
+    args[1] = r"(?:www\.|)%s" % args[1]
     return "^%s://%s%s" % tuple(args)
 
 
 class InternPatternUrl(urlbase.UrlBase):
     """Class supporting an intern URL pattern."""
 
+    __slots__ = ()
+
     def get_intern_pattern(self, url=None):
         """
         Get pattern for intern URL matching.
@@ -24,6 +24,8 @@ from . import urlbase
 class UnknownUrl(urlbase.UrlBase):
     """Handle unknown or just plain broken URLs."""
 
+    __slots__ = ()
+
     def build_url(self):
         """Only logs that this URL is unknown."""
         super().build_url()
@@ -56,7 +56,38 @@ from .const import (
 from ..url import url_fix_wayback_query
 
 # schemes that are invalid with an empty hostname
-scheme_requires_host = ("ftp", "http")
+scheme_requires_host = frozenset(("ftp", "http"))
+
+# file types that can be parsed recursively
+ContentMimetypes = {
+    "text/html": "html",
+    "application/xhtml+xml": "html",
+    # Include PHP file which helps when checking local .php files.
+    # It does not harm other URL schemes like HTTP since HTTP servers
+    # should not send this content type. They send text/html instead.
+    "application/x-httpd-php": "html",
+    "text/css": "css",
+    "application/vnd.adobe.flash.movie": "swf",
+    "application/x-shockwave-flash": "swf",
+    "application/msword": "word",
+    "text/plain+linkchecker": "text",
+    "text/plain+opera": "opera",
+    "text/plain+chromium": "chromium",
+    "application/x-plist+safari": "safari",
+    "text/vnd.wap.wml": "wml",
+    "application/xml+sitemap": "sitemap",
+    "application/xml+sitemapindex": "sitemapindex",
+    "application/pdf": "pdf",
+    "application/x-pdf": "pdf",
+}
+
+# MIME types checked by UrlBase.is_html() and UrlBase.is_css()
+HtmlMimetypes = frozenset(
+    mime for mime, ctype in ContentMimetypes.items() if ctype == "html"
+)
+CssMimetypes = frozenset(
+    mime for mime, ctype in ContentMimetypes.items() if ctype == "css"
+)
 
 
 def urljoin(parent, url):
@@ -85,28 +116,51 @@ def url_norm(url, encoding):
 class UrlBase:
     """An URL with additional information like validity etc."""
 
-    # file types that can be parsed recursively
-    ContentMimetypes = {
-        "text/html": "html",
-        "application/xhtml+xml": "html",
-        # Include PHP file which helps when checking local .php files.
-        # It does not harm other URL schemes like HTTP since HTTP servers
-        # should not send this content type. They send text/html instead.
-        "application/x-httpd-php": "html",
-        "text/css": "css",
-        "application/vnd.adobe.flash.movie": "swf",
-        "application/x-shockwave-flash": "swf",
-        "application/msword": "word",
-        "text/plain+linkchecker": "text",
-        "text/plain+opera": "opera",
-        "text/plain+chromium": "chromium",
-        "application/x-plist+safari": "safari",
-        "text/vnd.wap.wml": "wml",
-        "application/xml+sitemap": "sitemap",
-        "application/xml+sitemapindex": "sitemapindex",
-        "application/pdf": "pdf",
-        "application/x-pdf": "pdf",
-    }
+    # Lots of these objects are alive during a check run, so avoid
+    # a per-instance __dict__. Subclasses must define __slots__ too.
+    __slots__ = (
+        "aggregate",
+        "aliases",
+        "anchor",
+        "base_ref",
+        "base_url",
+        "cache_url",
+        "caching",
+        "checktime",
+        "column",
+        "content_encoding",
+        "content_type",
+        "data",
+        "dltime",
+        "do_check_content",
+        "encoding",
+        "extern",
+        "has_result",
+        "host",
+        "ignore_errors",
+        "info",
+        "line",
+        "modified",
+        "name",
+        "page",
+        "parent_url",
+        "port",
+        "recursion_level",
+        "result",
+        "scheme",
+        "size",
+        "soup",
+        "text",
+        "title",
+        "url",
+        "url_connection",
+        "urlparts",
+        "userinfo",
+        "valid",
+        "warnings",
+        "_info_seen",
+        "_warnings_seen",
+    )
 
     # Read in 16kb chunks
     ReadChunkBytes = 1024 * 16
@@ -210,7 +264,7 @@ class UrlBase:
             )
         url = absolute_url(self.base_url, base_ref, parent_url)
         # assume file link if no scheme is found
-        self.scheme = url.split(":", 1)[0].lower() or "file"
+        self.scheme = url.partition(":")[0].lower() or "file"
         if self.base_url != base_url:
             self.add_warning(
                 _("Leading or trailing whitespace in URL `%(url)s'.")
@@ -241,6 +295,9 @@ class UrlBase:
         self.warnings = []
         # list of infos
         self.info = []
+        # sets of the above for fast duplicate checks
+        self._warnings_seen = set()
+        self._info_seen = set()
         # content size
         self.size = -1
         # last modification time of content in HTTP-date format
@@ -296,14 +353,17 @@ class UrlBase:
         self.result = msg
         self.valid = valid
 
-        if not self.valid:
-            for url_regex, msg_regex in self.ignore_errors:
-                if not url_regex.search(self.url):
-                    continue
-                if not msg_regex.search(self.result):
-                    continue
-                self.valid = True
-                self.result = f"Ignored: {self.result}"
+        if not self.valid and self.ignore_errors:
+            combined = self.aggregate.ignore_errors_url
+            if combined is None or combined.search(self.url):
+                for url_regex, msg_regex in self.ignore_errors:
+                    if not url_regex.search(self.url):
+                        continue
+                    if not msg_regex.search(self.result):
+                        continue
+                    self.valid = True
+                    self.result = f"Ignored: {self.result}"
+                    break
 
         # free content data
         self.data = None
@@ -328,7 +388,7 @@ class UrlBase:
         """
         Return True iff the content type of this url is parseable.
         """
-        if self.content_type in self.ContentMimetypes:
+        if self.content_type in ContentMimetypes:
             return True
         log.debug(
             LOG_CHECK,
@@ -350,18 +410,11 @@ class UrlBase:
 
     def is_html(self):
         """Return True iff content of this url is HTML formatted."""
-        return self._is_ctype("html")
+        return self.valid and self.content_type in HtmlMimetypes
 
     def is_css(self):
         """Return True iff content of this url is CSS stylesheet."""
-        return self._is_ctype("css")
-
-    def _is_ctype(self, ctype):
-        """Return True iff content is valid and of the given type."""
-        if not self.valid:
-            return False
-        mime = self.content_type
-        return self.ContentMimetypes.get(mime) == ctype
+        return self.valid and self.content_type in CssMimetypes
 
     def is_http(self):
         """Return True for *http://* or *https://* URLs."""
@@ -383,28 +436,46 @@ class UrlBase:
         """
         Add a warning string.
         """
+        if tag in self.aggregate.ignorewarnings:
+            self.add_info(s)
+            return
         item = (tag, s)
-        if item not in self.warnings:
-            if tag in self.aggregate.config["ignorewarnings"]:
-                self.add_info(s)
-            else:
-                self.warnings.append(item)
+        if item not in self._warnings_seen:
+            self._warnings_seen.add(item)
+            self.warnings.append(item)
 
     def add_info(self, s):
         """
         Add an info string.
         """
-        if s not in self.info:
+        if s not in self._info_seen:
+            self._info_seen.add(s)
             self.info.append(s)
 
     def set_cache_url(self):
         """Set the URL to be used for caching."""
-        if "AnchorCheck" in self.aggregate.config["enabledplugins"]:
+        if "AnchorCheck" in self.aggregate.enabledplugins:
             self.cache_url = self.url
         else:
             # remove anchor from cached target url since we assume
             # URLs with different anchors to have the same content
-            self.cache_url = urlutil.urlunsplit(self.urlparts[:4] + [''])
+            scheme, netloc, path, query = self.urlparts[:4]
+            if (
+                scheme
+                and netloc
+                and scheme != "file"
+                and path[:1] in ("/", "")
+            ):
+                # fast path for the common scheme://netloc/path form,
+                # giving the same result as urlunsplit()
+                if query:
+                    self.cache_url = f"{scheme}://{netloc}{path}?{query}"
+                else:
+                    self.cache_url = f"{scheme}://{netloc}{path}"
+            else:
+                self.cache_url = urlutil.urlunsplit(
+                    (scheme, netloc, path, query, '')
+                )
         log.debug(LOG_CHECK, "cache_url '%s'", self.cache_url)
 
     def check_syntax(self):
@@ -492,8 +563,9 @@ class UrlBase:
             raise LinkCheckerError(
                 _("URL host %(host)r has invalid port") % {"host": host}
             )
+        default_port = urlutil.default_ports.get(self.scheme)
         if port is None:
-            port = urlutil.default_ports.get(self.scheme, 0)
+            port = default_port or 0
         if port is None:
             raise LinkCheckerError(
                 _("URL host %(host)r has invalid port") % {"host": host}
@@ -505,7 +577,7 @@ class UrlBase:
             if not self.host:
                 raise LinkCheckerError(_("URL has empty hostname"))
             self.check_obfuscated_ip()
-        if not self.port or self.port == urlutil.default_ports.get(self.scheme):
+        if not self.port or self.port == default_port:
             host = self.host
         else:
             host = f"{self.host}:{self.port}"
@@ -639,7 +711,7 @@ class UrlBase:
     def add_size_info(self):
         """Set size of URL content (if any)..
         Should be overridden in subclasses."""
-        maxbytes = self.aggregate.config["maxfilesizedownload"]
+        maxbytes = self.aggregate.maxfilesizedownload
         if self.size > maxbytes:
             self.add_warning(
                 _("Content size %(size)s is larger than %(maxbytes)s.")
@@ -652,7 +724,7 @@ class UrlBase:
 
     def allows_simple_recursion(self):
         """Check recursion level and extern status."""
-        rec_level = self.aggregate.config["recursionlevel"]
+        rec_level = self.aggregate.recursionlevel
         if rec_level >= 0 and self.recursion_level >= rec_level:
             log.debug(LOG_CHECK, "... no, maximum recursion level reached.")
             return False
@@ -674,7 +746,7 @@ class UrlBase:
             return False
         if not self.allows_simple_recursion():
             return False
-        if self.size > self.aggregate.config["maxfilesizeparse"]:
+        if self.size > self.aggregate.maxfilesizeparse:
             log.debug(LOG_CHECK, "... no, maximum parse size.")
             return False
         if not self.is_parseable():
@@ -703,19 +775,16 @@ class UrlBase:
         if not url:
             self.extern = (1, 1)
             return
-        for entry in self.aggregate.config["externlinks"]:
-            match = entry['pattern'].search(url)
-            if (entry['negate'] and not match) or (match and not entry['negate']):
-                log.debug(LOG_CHECK, "Extern URL %r", url)
-                self.extern = (1, entry['strict'])
-                return
-        for entry in self.aggregate.config["internlinks"]:
-            match = entry['pattern'].search(url)
-            if (entry['negate'] and not match) or (match and not entry['negate']):
-                log.debug(LOG_CHECK, "Intern URL %r", url)
-                self.extern = (0, 0)
-                return
-        if self.aggregate.config['checkextern']:
+        entry = self.aggregate.match_link_pats("externlinks", url)
+        if entry is not None:
+            log.debug(LOG_CHECK, "Extern URL %r", url)
+            self.extern = (1, entry['strict'])
+            return
+        if self.aggregate.match_link_pats("internlinks", url) is not None:
+            log.debug(LOG_CHECK, "Intern URL %r", url)
+            self.extern = (0, 0)
+            return
+        if self.aggregate.checkextern:
             self.extern = (1, 0)
         else:
             self.extern = (1, 1)
@@ -727,7 +796,7 @@ class UrlBase:
 
     def can_get_content(self):
         """Indicate whether url get_content() can be called."""
-        return self.size <= self.aggregate.config["maxfilesizedownload"]
+        return self.size <= self.aggregate.maxfilesizedownload
 
     def download_content(self):
         log.debug(LOG_CHECK, "Get content of %r", self.url)
@@ -743,7 +812,7 @@ class UrlBase:
 
     def get_soup(self):
         if self.soup is None:
-            self.get_content()
+            self.soup = htmlsoup.make_soup(self.get_content())
         return self.soup
 
     def get_raw_content(self):
@@ -754,28 +823,34 @@ class UrlBase:
     def get_content(self, encoding=None):
         if self.text is None:
             self.get_raw_content()
-            self.soup = htmlsoup.make_soup(self.data, encoding)
-            # Sometimes soup.original_encoding is None!  Better mangled text
-            # than an internal crash, eh?  ISO-8859-1 is a safe fallback in the
-            # sense that any binary blob can be decoded, it'll never cause a
-            # UnicodeDecodeError.
-            log.debug(
-                LOG_CHECK, "Beautiful Soup detected %s", self.soup.original_encoding
-            )
-            self.content_encoding = self.soup.original_encoding or 'ISO-8859-1'
+            encoding = htmlsoup.get_encoding(self.data, encoding)
+            log.debug(LOG_CHECK, "Detected encoding %s", encoding)
+            try:
+                self.content_encoding = encoding or 'utf-8'
+                self.text = self.data.decode(self.content_encoding)
+            except UnicodeDecodeError:
+                # ISO-8859-1 is a safe fallback in the sense that any
+                # binary blob can be decoded, it'll never cause a
+                # UnicodeDecodeError. Better mangled text than an
+                # internal crash, eh?
+                self.content_encoding = 'ISO-8859-1'
+                self.text = self.data.decode(self.content_encoding)
             log.debug(LOG_CHECK, "Content encoding %s", self.content_encoding)
-            self.text = self.data.decode(self.content_encoding)
         return self.text
 
     def read_content(self):
         """Return data for this URL. Can be overridden in subclasses."""
+        maxbytes = self.aggregate.maxfilesizedownload
+        # BytesIO.getvalue() does not copy the buffer when nothing else
+        # references it, unlike bytes(bytearray)
         buf = BytesIO()
-        data = self.read_content_chunk()
+        read_content_chunk = self.read_content_chunk
+        data = read_content_chunk()
         while data:
-            if buf.tell() + len(data) > self.aggregate.config["maxfilesizedownload"]:
+            if buf.tell() + len(data) > maxbytes:
                 raise LinkCheckerError(_("File size too large"))
             buf.write(data)
-            data = self.read_content_chunk()
+            data = read_content_chunk()
         return buf.getvalue()
 
     def read_content_chunk(self):
@@ -819,21 +894,19 @@ class UrlBase:
         """
         Return serialized url check data as unicode string.
         """
-        return sep.join(
-            [
-                "%s link" % self.scheme,
-                "base_url=%r" % self.base_url,
-                "parent_url=%r" % self.parent_url,
-                "base_ref=%r" % self.base_ref,
-                "recursion_level=%d" % self.recursion_level,
-                "url_connection=%s" % self.url_connection,
-                "line=%s" % self.line,
-                "column=%s" % self.column,
-                "page=%d" % self.page,
-                "name=%r" % self.name,
-                "anchor=%r" % self.anchor,
-                "cache_url=%s" % self.cache_url,
-            ]
+        return (
+            f"{self.scheme} link{sep}"
+            f"base_url={self.base_url!r}{sep}"
+            f"parent_url={self.parent_url!r}{sep}"
+            f"base_ref={self.base_ref!r}{sep}"
+            f"recursion_level={self.recursion_level:d}{sep}"
+            f"url_connection={self.url_connection}{sep}"
+            f"line={self.line}{sep}"
+            f"column={self.column}{sep}"
+            f"page={self.page:d}{sep}"
+            f"name={self.name!r}{sep}"
+            f"anchor={self.anchor!r}{sep}"
+            f"cache_url={self.cache_url}"
         )
 
     def get_intern_pattern(self, url=None):
@@ -850,8 +923,10 @@ class UrlBase:
         """Add intern URL regex to config."""
         try:
             pat = self.get_intern_pattern(url=url)
-            if pat:
+            # start URLs of the same site often give the same pattern
+            if pat and pat not in self.aggregate.intern_pats:
                 log.debug(LOG_CHECK, "Add intern pattern %r", pat)
+                self.aggregate.intern_pats.add(pat)
                 self.aggregate.config['internlinks'].append(get_link_pat(pat))
         except UnicodeError as msg:
             res = _("URL has unparsable domain name: %(domain)s") % {"domain": msg}
@@ -894,7 +969,7 @@ class UrlBase:
           Indicates if URL is valid
         - url_data.result: unicode
           Result string
-        - url_data.warnings: list of tuples (tag, warning message)
+        - url_data.warnings: tuple of tuples (tag, warning message)
           List of tagged warnings for this URL.
         - url_data.name: unicode string or None
           name of URL (eg. filename or link name)
@@ -929,35 +1004,41 @@ class UrlBase:
         - url_data.last_modified: datetime
           Last modification date of retrieved page (or None).
         """
-        return dict(
-            valid=self.valid,
-            extern=self.extern[0],
-            result=self.result,
-            warnings=self.warnings[:],
-            name=self.name or "",
-            title=self.get_title(),
-            parent_url=self.parent_url or "",
-            base_ref=self.base_ref or "",
-            base_url=self.base_url or "",
-            url=self.url or "",
-            domain=(self.urlparts[1] if self.urlparts else ""),
-            checktime=self.checktime,
-            dltime=self.dltime,
-            size=self.size,
-            info=self.info,
-            line=self.line,
-            column=self.column,
-            page=self.page,
-            cache_url=self.cache_url,
-            content_type=self.content_type,
-            level=self.recursion_level,
-            modified=self.modified,
+        return dict(zip(urlDataAttr, self.to_wire_tuple()))
+
+    def to_wire_tuple(self):
+        """Return the values of to_wire_dict() as a tuple in the order
+        of urlDataAttr."""
+        share_string = self.aggregate.share_string
+        return (
+            self.valid,
+            self.extern[0],
+            self.result,
+            tuple(self.warnings),
+            self.name or "",
+            self.get_title(),
+            self.parent_url or "",
+            share_string(self.base_ref or ""),
+            self.base_url or "",
+            self.url or "",
+            share_string(self.urlparts[1] if self.urlparts else ""),
+            self.checktime,
+            self.dltime,
+            self.size,
+            self.info,
+            self.modified,
+            self.line,
+            self.column,
+            self.page,
+            self.cache_url,
+            share_string(self.content_type),
+            self.recursion_level,
         )
 
     def to_wire(self):
         """Return compact UrlData object with information from to_wire_dict().
         """
-        return CompactUrlData(self.to_wire_dict())
+        return CompactUrlData.from_tuple(self.to_wire_tuple())
 
 
 urlDataAttr = [
@@ -991,7 +1072,36 @@ class CompactUrlData:
 
     __slots__ = urlDataAttr
 
-    def __init__(self, wired_url_data):
-        '''Set all attributes according to the dictionary wired_url_data'''
-        for attr in urlDataAttr:
-            setattr(self, attr, wired_url_data[attr])
+
+def _make_function(name, source, doc):
+    """Compile the source of a single function and return the function.
+    Used for generating code that reads or sets each attribute of
+    urlDataAttr, which is faster than getattr() or setattr() in a loop."""
+    namespace = {}
+    exec(source, namespace)
+    func = namespace[name]
+    func.__doc__ = doc
+    return func
+
+
+_self_attrs = ", ".join(f"self.{attr}" for attr in urlDataAttr)
+CompactUrlData.__init__ = _make_function(
+    "__init__",
+    "def __init__(self, wired_url_data):\n"
+    + "\n".join(f"    self.{attr} = wired_url_data[{attr!r}]" for attr in urlDataAttr),
+    "Set all attributes according to the dictionary wired_url_data",
+)
+CompactUrlData.from_tuple = classmethod(_make_function(
+    "from_tuple",
+    "def from_tuple(cls, values):\n"
+    "    self = cls.__new__(cls)\n"
+    f"    {_self_attrs} = values\n"
+    "    return self",
+    "Return a new object with the values in the order of urlDataAttr",
+))
+CompactUrlData.__copy__ = _make_function(
+    "__copy__",
+    "def __copy__(self):\n"
+    f"    return self.from_tuple(({_self_attrs}))",
+    "Return a shallow copy, faster than the generic copy of __slots__",
+)
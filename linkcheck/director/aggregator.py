@@ -16,13 +16,14 @@
 """
 Aggregate needed object instances for checker threads.
 """
+import itertools
 import threading
 
 import requests
 import time
 import urllib.parse
 import random
-from .. import log, LOG_CHECK, strformat, LinkCheckerError
+from .. import log, LOG_CHECK, strformat, LinkCheckerError, get_combined_pat
 from ..decorators import synchronized
 from ..cache import urlqueue
 from ..htmlutil import loginformsearch
@@ -34,6 +35,9 @@ _threads_lock = threading.RLock()
 _hosts_lock = threading.RLock()
 _downloadedbytes_lock = threading.RLock()
 
+# maximum number of strings kept by Aggregate.share_string()
+_shared_strings_max = 10000
+
 
 def new_request_session(config, cookies):
     """Create a new request session."""
@@ -78,6 +82,24 @@ class Aggregate:
         self.wait_time_min = 1.0 / requests_per_second
         self.wait_time_max = 6 * self.wait_time_min
         self.downloaded_bytes = 0
+        # configuration values used for every URL; the configuration
+        # does not change while checking
+        self.maxfilesizedownload = config["maxfilesizedownload"]
+        self.maxfilesizeparse = config["maxfilesizeparse"]
+        self.recursionlevel = config["recursionlevel"]
+        self.ignorewarnings = frozenset(config["ignorewarnings"])
+        self.enabledplugins = config["enabledplugins"]
+        self.checkextern = config["checkextern"]
+        # {config key -> (number of entries, negated entries, combined pattern)}
+        self.link_pats = {}
+        # intern patterns added by start URLs
+        self.intern_pats = set()
+        # {string -> string} see share_string()
+        self.shared_strings = {}
+        # one search tells if any URL pattern of ignoreerrors can match
+        self.ignore_errors_url = get_combined_pat(
+            [url_regex for url_regex, msg_regex in config["ignoreerrors"]]
+        )
 
     def visit_loginurl(self):
         """Check for a login URL and visit it."""
@@ -115,6 +137,51 @@ class Aggregate:
         if len(self.cookies) == 0:
             raise LinkCheckerError("No cookies set by login URL %s" % url)
 
+    def match_link_pats(self, key, url):
+        """Return the first entry of the link pattern list config[key]
+        (externlinks or internlinks) that matches the given URL, or None.
+        See get_link_pat() for the format of the entries.
+        """
+        entries = self.config[key]
+        num, negated, combined = self.link_pats.get(key, (-1, None, None))
+        if len(entries) > 2 * num:
+            # Internlinks grows while checking. Rebuilding only after the
+            # list doubled keeps the total cost of compiling linear.
+            snapshot = entries[:]
+            num = len(snapshot)
+            negated = [entry for entry in snapshot if entry['negate']]
+            combined = get_combined_pat(
+                [entry['pattern'] for entry in snapshot if not entry['negate']]
+            )
+            self.link_pats[key] = (num, negated, combined)
+        if combined is None or combined.search(url):
+            candidates = entries
+        else:
+            # none of the first num non-negated patterns matches
+            candidates = itertools.chain(negated, entries[num:])
+        for entry in candidates:
+            if bool(entry['pattern'].search(url)) != entry['negate']:
+                return entry
+        return None
+
+    def get_combined_link_pat(self, key):
+        """Return the combined pattern match_link_pats() uses to skip the
+        non-negated patterns of config[key], or None if it has none."""
+        return self.link_pats.get(key, (-1, None, None))[2]
+
+    def share_string(self, s):
+        """Return a copy of the non-empty string s shared by all wire
+        objects of this check, else s. Domains and content types repeat
+        across many URLs. The memo is emptied when it gets too large.
+        No lock is needed: setdefault() is atomic, and a concurrent
+        clear() only loses some sharing.
+        """
+        if not s:
+            return s
+        if len(self.shared_strings) >= _shared_strings_max:
+            self.shared_strings.clear()
+        return self.shared_strings.setdefault(s, s)
+
     @synchronized(_threads_lock)
     def start_threads(self):
         """Spawn threads for URL checking and status printing."""
@@ -57,6 +57,16 @@ def get_size(filename):
         return -1
 
 
+def get_size_mtime(filename):
+    """Return tuple (size in Bytes, modification time) of filename
+    with only one system call, or (-1, 0) on errors."""
+    try:
+        st = os.stat(filename)
+    except os.error:
+        return -1, 0
+    return st.st_size, st.st_mtime
+
+
 # http://developer.gnome.org/doc/API/2.0/glib/glib-running.html
 if "G_FILENAME_ENCODING" in os.environ:
     FSCODING = os.environ["G_FILENAME_ENCODING"].split(",")[0]
@@ -17,6 +17,8 @@
 HTML parser implemented using Beautiful Soup and html.parser.
 """
 
+import codecs
+import re
 import warnings
 
 warnings.filterwarnings(
@@ -43,3 +45,41 @@ def make_soup(markup, from_encoding=None):
     return bs4.BeautifulSoup(
         markup, "html.parser", from_encoding=from_encoding, multi_valued_attributes=None
     )
+
+
+# encoding declared in a meta tag or XML declaration
+_declared_encoding = re.compile(
+    rb"""<(?:meta\s[^>]*?charset|\?xml\s[^>]*?encoding)\s*=\s*["']?\s*([\w.:-]+)""",
+    re.IGNORECASE,
+).search
+
+
+def _lookup(encoding):
+    """Return the given encoding if Python knows it as a text encoding,
+    else None. Codecs like base64 or zlib can not decode bytes to str."""
+    try:
+        # decoding empty bytes skips the codec lookup, so decode one byte
+        b"a".decode(encoding)
+    except LookupError:
+        return None
+    except UnicodeDecodeError:
+        # e.g. UTF-16 needs at least two bytes
+        pass
+    return encoding
+
+
+def get_encoding(markup, from_encoding=None):
+    """Return the encoding of markup from its byte order mark, the
+    given encoding (e.g. from the HTTP header) or a charset declared in
+    the first 1024 bytes, in this order. Return None if none is found.
+    Unlike Beautiful Soup this never scans the whole document."""
+    if markup.startswith(codecs.BOM_UTF8):
+        return "utf-8"
+    if markup[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+        return "utf-16"
+    if from_encoding and _lookup(from_encoding):
+        return from_encoding
+    mo = _declared_encoding(markup, 0, 1024)
+    if mo:
+        return _lookup(mo.group(1).decode("ascii").lower())
+    return None
@@ -19,6 +19,7 @@ Main functions for link parsing
 from .. import strformat, url as urlutil
 from ..htmlutil import linkparse
 from ..bookmarks import firefox
+from ..checker.urlbase import ContentMimetypes
 
 
 def parse_url(url_data):
@@ -37,7 +38,7 @@ def parse_url(url_data):
     else:
         # determine parse routine according to content types
         mime = url_data.content_type
-        key = url_data.ContentMimetypes[mime]
+        key = ContentMimetypes[mime]
     funcname = "parse_" + key
     if funcname in globals():
         globals()[funcname](url_data)
@@ -329,6 +329,16 @@ _relparentdir_ro = re.compile(r"^(?!\.\./)[^/]+/\.\.(/|$)")
 def collapse_segments(path):
     """Remove all redundant segments from the given URL path.
     Precondition: path is an unquoted url path"""
+    # Most paths have nothing to collapse. All substitutions below need
+    # a backslash, a double slash or a dot segment, so skip them if the
+    # path has none of these.
+    if (
+        "\\" not in path
+        and "//" not in path
+        and "/." not in path
+        and "./" not in path
+    ):
+        return path
     # replace backslashes
     # note: this is _against_ the specification (which would require
     # backslashes to be left alone, and finally quoted with '%5C')
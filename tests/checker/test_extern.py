@@ -0,0 +1,87 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Test matching of extern and intern link patterns.
+"""
+import unittest
+
+import linkcheck.configuration
+import linkcheck.director
+from linkcheck import get_link_pat
+from . import get_url_from
+
+
+def get_extern(url, externlinks=(), internlinks=(), aggregate=None):
+    """Return the extern flags of a new URL object for the given URL."""
+    if aggregate is None:
+        config = linkcheck.configuration.Configuration()
+        config["externlinks"].extend(externlinks)
+        config["internlinks"].extend(internlinks)
+        aggregate = linkcheck.director.get_aggregate(config)
+    return get_url_from(url, 1, aggregate).extern
+
+
+class TestExtern(unittest.TestCase):
+    """Test the extern and intern link patterns."""
+
+    def test_first_pattern_wins(self):
+        # the second pattern matches further left, but the first
+        # matching entry in the list decides about strict checking
+        externlinks = [
+            get_link_pat("foo", strict=False),
+            get_link_pat("^http", strict=True),
+        ]
+        extern = get_extern("http://example.org/foo", externlinks)
+        self.assertEqual(extern, (1, False))
+
+    def test_negate(self):
+        externlinks = [get_link_pat(r"!^http://example\.org/", strict=True)]
+        extern = get_extern("http://example.com/", externlinks)
+        self.assertEqual(extern, (1, True))
+        internlinks = [get_link_pat(r"^http://example\.org/")]
+        extern = get_extern("http://example.org/", externlinks, internlinks)
+        self.assertEqual(extern, (0, 0))
+
+    def test_no_match(self):
+        externlinks = [get_link_pat("foo", strict=False)]
+        internlinks = [get_link_pat(r"^http://example\.org/")]
+        extern = get_extern("http://example.com/", externlinks, internlinks)
+        self.assertEqual(extern, (1, 1))
+
+    def test_internlinks_grow(self):
+        config = linkcheck.configuration.Configuration()
+        aggregate = linkcheck.director.get_aggregate(config)
+        for i in range(10):
+            url = "http://example%d.org/" % i
+            # start URLs add their own intern pattern
+            get_url_from(url, 0, aggregate)
+            self.assertEqual(get_extern(url + "a", aggregate=aggregate), (0, 0))
+        for i in range(10):
+            url = "http://example%d.org/b" % i
+            self.assertEqual(get_extern(url, aggregate=aggregate), (0, 0))
+        url = "http://example.com/"
+        self.assertEqual(get_extern(url, aggregate=aggregate), (1, 1))
+        # the intern patterns of start URLs can be combined
+        self.assertIsNotNone(aggregate.get_combined_link_pat("internlinks"))
+
+    def test_intern_pattern_once(self):
+        config = linkcheck.configuration.Configuration()
+        aggregate = linkcheck.director.get_aggregate(config)
+        get_url_from("http://example.org/a.html", 0, aggregate)
+        get_url_from("http://example.org/b.html", 0, aggregate)
+        self.assertEqual(len(config["internlinks"]), 1)
+        get_url_from("http://example.org/sub/", 0, aggregate)
+        self.assertEqual(len(config["internlinks"]), 2)
@@ -68,6 +68,24 @@ class TestFile(LinkCheckTest):
         self._test("mailto:foo", r"^mailto:foo$",
                    r"^Missing `@' in mail address `foo'.$", True)
 
+    def test_multiple_rules(self):
+        """ Test that every rule is tried, not only the first match. """
+        url = "mailto:foo"
+        confargs = {
+            "ignoreerrors": [
+                (re_compile(r"^mailto:"), re_compile("^no-match$")),
+                (re_compile(r"^http:"), re_compile("")),
+                (re_compile(r"foo$"), re_compile("^Missing")),
+            ]
+        }
+        resultlines = [
+            "url %s" % url,
+            "cache key %s" % url,
+            "real url %s" % url,
+            "valid",
+        ]
+        self.direct(url, resultlines, confargs=confargs)
+
     @need_network
     def test_internet(self):
         """ Test a few well-known Internet URLs. """
@@ -0,0 +1,99 @@
+# Copyright (C) 2026 LinkChecker Authors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+Test the compact transport objects used for logging and caching.
+"""
+import copy
+import unittest
+
+import linkcheck.configuration
+import linkcheck.director
+from linkcheck.checker.urlbase import CompactUrlData, urlDataAttr
+from . import get_url_from
+
+
+def get_url_data(url="http://example.org/a?b=c#d", aggregate=None):
+    """Return a new URL object with a warning and an info message."""
+    if aggregate is None:
+        config = linkcheck.configuration.Configuration()
+        aggregate = linkcheck.director.get_aggregate(config)
+    url_data = get_url_from(url, 0, aggregate, parent_url="http://example.org/")
+    url_data.add_warning("warning", tag="tag")
+    url_data.add_info("info")
+    return url_data
+
+
+class TestWire(unittest.TestCase):
+    """Test to_wire() and CompactUrlData."""
+
+    def test_wire_dict(self):
+        url_data = get_url_data()
+        wire_dict = url_data.to_wire_dict()
+        self.assertEqual(list(wire_dict), urlDataAttr)
+        self.assertEqual(wire_dict["domain"], "example.org")
+        self.assertEqual(wire_dict["parent_url"], "http://example.org/")
+        self.assertEqual(wire_dict["cache_url"], "http://example.org/a?b=c")
+        self.assertEqual(wire_dict["warnings"], (("tag", "warning"),))
+        self.assertEqual(wire_dict["info"], ["info"])
+
+    def test_to_wire(self):
+        url_data = get_url_data()
+        wire_dict = url_data.to_wire_dict()
+        compact = url_data.to_wire()
+        for attr in urlDataAttr:
+            self.assertEqual(getattr(compact, attr), wire_dict[attr], attr)
+        compact = CompactUrlData(wire_dict)
+        for attr in urlDataAttr:
+            self.assertEqual(getattr(compact, attr), wire_dict[attr], attr)
+
+    def test_wire_fields(self):
+        url_data = get_url_data("http://example.org/a?b=c#d")
+        url_data.recursion_level = 2
+        compact = url_data.to_wire()
+        self.assertEqual(compact.domain, "example.org")
+        self.assertEqual(compact.url, "http://example.org/a?b=c#d")
+        self.assertEqual(compact.level, 2)
+        self.assertEqual(compact.parent_url, "http://example.org/")
+
+    def test_shared_strings(self):
+        config = linkcheck.configuration.Configuration()
+        aggregate = linkcheck.director.get_aggregate(config)
+        first = get_url_data("http://example.org/a", aggregate).to_wire()
+        second = get_url_data("http://example.org/b", aggregate).to_wire()
+        self.assertIs(first.domain, second.domain)
+        self.assertIs(first.content_type, second.content_type)
+
+    def test_shared_strings_limit(self):
+        config = linkcheck.configuration.Configuration()
+        aggregate = linkcheck.director.get_aggregate(config)
+        for i in range(linkcheck.director.aggregator._shared_strings_max + 1):
+            aggregate.share_string("example%d.org" % i)
+        self.assertEqual(len(aggregate.shared_strings), 1)
+
+    def test_warnings_copy(self):
+        url_data = get_url_data()
+        compact = url_data.to_wire()
+        url_data.add_warning("another warning")
+        self.assertEqual(compact.warnings, (("tag", "warning"),))
+
+    def test_copy(self):
+        compact = get_url_data().to_wire()
+        copied = copy.copy(compact)
+        self.assertIsNot(copied, compact)
+        for attr in urlDataAttr:
+            self.assertIs(getattr(copied, attr), getattr(compact, attr), attr)
+        copied.line = 42
+        self.assertIsNone(compact.line)
@@ -34,3 +34,11 @@ class TestFileutil(unittest.TestCase):
     def test_mtime(self):
         self.assertTrue(linkcheck.fileutil.get_mtime(file_existing) > 0)
         self.assertEqual(linkcheck.fileutil.get_mtime(file_non_existing), 0)
+
+    def test_size_mtime(self):
+        size, mtime = linkcheck.fileutil.get_size_mtime(file_existing)
+        self.assertEqual(size, linkcheck.fileutil.get_size(file_existing))
+        self.assertEqual(mtime, linkcheck.fileutil.get_mtime(file_existing))
+        self.assertEqual(
+            linkcheck.fileutil.get_size_mtime(file_non_existing), (-1, 0)
+        )
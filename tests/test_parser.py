@@ -201,3 +201,23 @@ class TestParser(unittest.TestCase):
         # based on cchardet/chardet/charset-normalizer availability.
         soup = htmlsoup.make_soup(html)
         self.assertEqual(soup.original_encoding, expected)
+
+    @parameterized.expand(
+        [
+            (b'<meta charset="UTF-8">', None, "utf-8"),
+            (b'<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=KOI8-R">',
+             None, "koi8-r"),
+            (b'<?xml version="1.0" encoding="ISO-8859-2"?>', None, "iso-8859-2"),
+            (b'<meta charset="hulla">', None, None),
+            (b'<meta charset="base64">', None, None),
+            (b'<meta charset="UTF-8">', "rot13", "utf-8"),
+            (b"<p>charset=utf-8</p>", None, None),
+            (b'<meta charset="UTF-8">', "iso-8859-1", "iso-8859-1"),
+            (b'<meta charset="UTF-8">', "blabla", "utf-8"),
+            (b'\xef\xbb\xbf<meta charset="ISO8859-1">', "iso-8859-1", "utf-8"),
+            (b"\xff\xfe<\x00p\x00>\x00", None, "utf-16"),
+            (b" " * 1024 + b'<meta charset="UTF-8">', None, None),
+        ]
+    )
+    def test_get_encoding(self, html, from_encoding, expected):
+        self.assertEqual(htmlsoup.get_encoding(html, from_encoding), expected)
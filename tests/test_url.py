@@ -235,6 +235,11 @@ class TestUrl(unittest.TestCase):
         url = "http://example.com/../a/b"
         self.urlnormtest(url, nurl)
 
+    def test_collapse_segments_unchanged(self):
+        # Paths without redundant segments are returned as they are.
+        for path in ("", "/", "a", "/a/b.html", "a..b/c", "/a/b..", "..", "."):
+            self.assertEqual(linkcheck.url.collapse_segments(path), path)
+
     def test_norm_path_relative_dots(self):
         # Test url norm relative path handling with dots.
         # normalize redundant path segments